@@ -8,8 +8,69 @@ import seaborn as sns
 from datetime import datetime
 import os
 import warnings
+from collections import Counter
 warnings.filterwarnings('ignore')
 
+# Risk level thresholds (lower bound inclusive), matching get_risk_level
+RISK_LEVEL_BINS = [-np.inf, 0.15, 0.3, 0.5, 0.7, np.inf]
+RISK_LEVEL_LABELS = ['Very Low', 'Low', 'Medium', 'High', 'Very High']
+
+# Job title keywords and the risk category they map to; the first match wins
+RISK_CATEGORY_KEYWORDS = {
+    'data scientist': 'Data Scientist',
+    'machine learning': 'Machine Learning Engineer',
+    'product manager': 'Product Manager',
+    'devops': 'DevOps Engineer',
+    'frontend': 'Frontend Developer',
+    'backend': 'Backend Developer',
+    'full stack': 'Full Stack Developer',
+    'software engineer': 'Software Engineer',
+    'software developer': 'Software Engineer',
+    'cloud engineer': 'Cloud Engineer',
+    'security engineer': 'Security Engineer',
+    'data analyst': 'Data Analyst'
+}
+
+# Suggested mitigation strategies per risk level
+MITIGATION_STRATEGIES = {
+    'Very High Risk': [
+        'Immediate upskilling to more complex roles',
+        'Focus on creative and strategic aspects',
+        'Develop strong human interaction skills',
+        'Consider role transition within 1-2 years'
+    ],
+    'High Risk': [
+        'Start learning AI/ML to work alongside automation',
+        'Develop expertise in system design and architecture',
+        'Focus on complex problem-solving skills',
+        'Build domain expertise that AI cannot easily replicate'
+    ],
+    'Medium Risk': [
+        'Enhance creative and strategic thinking abilities',
+        'Develop leadership and communication skills',
+        'Learn to manage and optimize AI systems',
+        'Focus on cross-functional collaboration'
+    ],
+    'Low Risk': [
+        'Stay updated with AI developments in your field',
+        'Learn to leverage AI tools for productivity',
+        'Focus on innovation and creative solutions',
+        'Develop unique expertise and specializations'
+    ]
+}
+
+def map_to_risk_category(job_title):
+    """Map job titles to risk categories"""
+    if pd.isna(job_title):
+        return 'Software Engineer'
+    
+    title_lower = str(job_title).lower()
+    
+    for keyword, category in RISK_CATEGORY_KEYWORDS.items():
+        if keyword in title_lower:
+            return category
+    return 'Software Engineer'  # Default
+
 class AutomationRiskAnalyzer:
     """
     Analyzes automation risk for tech jobs based on:
@@ -36,6 +97,7 @@ class AutomationRiskAnalyzer:
         
         # Initialize risk profiles
         self._initialize_risk_profiles()
+        self._precompute_risk_scores()
         
         # AI capability timeline
         self.ai_timeline = {
@@ -126,55 +188,46 @@ class AutomationRiskAnalyzer:
             }
         }
     
+    def _precompute_risk_scores(self):
+        """Score every profiled role once so lookups skip the weighting loop"""
+        profiles = pd.DataFrame.from_dict(self.role_risk_profiles, orient='index').rename_axis('role')
+        
+        # Apply each weighted factor to all roles at once. A factor missing from a
+        # profile is treated as neutral (0.5) and contributes nothing. Summing one
+        # factor at a time (not a matmul) keeps the exact per-role float results
+        factor_matrix = profiles.reindex(columns=list(self.risk_factors)).fillna(0.5).to_numpy()
+        risk_scores = profiles['base_risk'].to_numpy(dtype=float, copy=True)
+        for column, weight in zip(factor_matrix.T, self.risk_factors.values()):
+            risk_scores += weight * (column - 0.5)
+        risk_scores = np.clip(risk_scores, 0, 1)
+        
+        # One role-indexed table of scores, levels and profile factors; every
+        # risk lookup and report reads from it
+        self.risk_table = profiles
+        self.risk_table.insert(0, 'automation_risk_score', risk_scores)
+        self.risk_table.insert(1, 'risk_level', list(self.get_risk_levels(risk_scores)))
+    
     def load_job_data(self):
         """Load job data from CSV"""
         try:
             self.df = pd.read_csv(self.job_data_path)
             print(f"✓ Loaded {len(self.df):,} job records")
-            self.df['risk_category'] = self.df['search_term'].map(self.map_to_risk_category)
+            self.df['risk_category'] = self.df['search_term'].map(map_to_risk_category)
         except FileNotFoundError:
             print(f"✗ File not found: {self.job_data_path}")
         except Exception as e:
             print(f"✗ Error loading data: {e}")
     
-    def map_to_risk_category(self, job_title):
-        """Map job titles to risk categories"""
-        title_lower = job_title.lower()
-        
-        mappings = {
-            'data scientist': 'Data Scientist',
-            'machine learning': 'Machine Learning Engineer',
-            'product manager': 'Product Manager',
-            'devops': 'DevOps Engineer',
-            'frontend': 'Frontend Developer',
-            'backend': 'Backend Developer',
-            'full stack': 'Full Stack Developer',
-            'software engineer': 'Software Engineer',
-            'software developer': 'Software Engineer',
-            'cloud engineer': 'Cloud Engineer',
-            'security engineer': 'Security Engineer',
-            'data analyst': 'Data Analyst'
-        }
-        
-        for keyword, category in mappings.items():
-            if keyword in title_lower:
-                return category
-        return 'Software Engineer'
-    
     def calculate_automation_risk(self, role):
         """Calculate automation risk score for a role"""
-        if role not in self.role_risk_profiles:
+        if role not in self.risk_table.index:
             return 0.5
         
-        profile = self.role_risk_profiles[role]
-        risk_score = profile['base_risk']
-        
-        # Apply weighted factors
-        for factor, weight in self.risk_factors.items():
-            if factor in profile:
-                risk_score += weight * (profile[factor] - 0.5)
-        
-        return max(0, min(1, risk_score))
+        return float(self.risk_table.at[role, 'automation_risk_score'])
+    
+    def calculate_automation_risk_batch(self, roles):
+        """Automation risk scores for many roles at once, 0.5 for unknown roles"""
+        return self.risk_table['automation_risk_score'].reindex(roles, fill_value=0.5).to_numpy()
     
     def get_risk_level(self, score):
         """Convert risk score to risk level"""
@@ -184,30 +237,35 @@ class AutomationRiskAnalyzer:
         elif score >= 0.15: return "Low"
         else: return "Very Low"
     
+    def get_risk_levels(self, scores):
+        """Convert many risk scores to risk levels in one vectorized pass"""
+        return pd.cut(scores, bins=RISK_LEVEL_BINS, labels=RISK_LEVEL_LABELS, right=False)
+    
+    def risk_rankings(self, factors=()):
+        """Roles with their risk score, level and any requested factors, highest risk first"""
+        columns = ['automation_risk_score', 'risk_level', *factors]
+        rankings = self.risk_table[columns].reset_index()
+        rankings.columns = ['Role', 'Risk Score', 'Risk Level', *(f.replace('_', ' ').title() for f in factors)]
+        return rankings.sort_values('Risk Score', ascending=False)
+    
+    def _format_rankings(self, risk_df):
+        """Render the ranking rows as one block of text, one line per role"""
+        return "".join(
+            f"{role:25} | Risk: {risk_score:.2f} ({risk_level})\n"
+            for role, risk_score, risk_level in zip(risk_df['Role'], risk_df['Risk Score'], risk_df['Risk Level'])
+        )
+    
     def analyze_risk_by_role(self):
         """Analyze automation risk for all roles"""
         print("\n" + "="*60)
         print("AUTOMATION RISK ANALYSIS BY ROLE")
         print("="*60)
         
-        risk_data = []
-        for role, profile in self.role_risk_profiles.items():
-            risk_score = self.calculate_automation_risk(role)
-            risk_data.append({
-                'Role': role,
-                'Risk Score': risk_score,
-                'Risk Level': self.get_risk_level(risk_score),
-                'Routine Tasks': profile['routine_tasks'],
-                'Human Interaction': profile['human_interaction'],
-                'Creative Problem Solving': profile['creative_problem_solving']
-            })
-        
-        risk_df = pd.DataFrame(risk_data).sort_values('Risk Score', ascending=False)
+        risk_df = self.risk_rankings(['routine_tasks', 'human_interaction', 'creative_problem_solving'])
         
         print("\nAutomation Risk Rankings:")
         print("-" * 60)
-        for _, row in risk_df.iterrows():
-            print(f"{row['Role']:25} | Risk: {row['Risk Score']:.2f} ({row['Risk Level']})")
+        print(self._format_rankings(risk_df), end="")
         
         return risk_df
     
@@ -260,37 +318,9 @@ class AutomationRiskAnalyzer:
         print("RISK MITIGATION STRATEGIES")
         print("="*60)
         
-        strategies = {
-            'Very High Risk': [
-                'Immediate upskilling to more complex roles',
-                'Focus on creative and strategic aspects',
-                'Develop strong human interaction skills',
-                'Consider role transition within 1-2 years'
-            ],
-            'High Risk': [
-                'Start learning AI/ML to work alongside automation',
-                'Develop expertise in system design and architecture',
-                'Focus on complex problem-solving skills',
-                'Build domain expertise that AI cannot easily replicate'
-            ],
-            'Medium Risk': [
-                'Enhance creative and strategic thinking abilities',
-                'Develop leadership and communication skills',
-                'Learn to manage and optimize AI systems',
-                'Focus on cross-functional collaboration'
-            ],
-            'Low Risk': [
-                'Stay updated with AI developments in your field',
-                'Learn to leverage AI tools for productivity',
-                'Focus on innovation and creative solutions',
-                'Develop unique expertise and specializations'
-            ]
-        }
-        
-        for risk_level, strategy_list in strategies.items():
-            print(f"\n{risk_level} Roles:")
-            for strategy in strategy_list:
-                print(f"  • {strategy}")
+        # One print per risk level instead of one per strategy line
+        for risk_level, strategy_list in MITIGATION_STRATEGIES.items():
+            print(f"\n{risk_level} Roles:\n" + "\n".join(f"  • {strategy}" for strategy in strategy_list))
     
     def create_risk_visualizations(self):
         """Create comprehensive risk visualization dashboard"""
@@ -298,14 +328,7 @@ class AutomationRiskAnalyzer:
         print("CREATING RISK VISUALIZATIONS")
         print("="*60)
         
-        risk_df = pd.DataFrame([
-            {
-                'Role': role,
-                'Risk Score': self.calculate_automation_risk(role),
-                'Risk Level': self.get_risk_level(self.calculate_automation_risk(role))
-            }
-            for role in self.role_risk_profiles
-        ]).sort_values('Risk Score', ascending=False)
+        risk_df = self.risk_rankings()
         
         # Create visualization
         fig, axes = plt.subplots(2, 2, figsize=(16, 12))
@@ -323,17 +346,18 @@ class AutomationRiskAnalyzer:
         ax1.grid(axis='x', alpha=0.3)
         
         # Add value labels
-        for i, (idx, row) in enumerate(risk_df.iterrows()):
-            ax1.text(row['Risk Score'] + 0.01, i, f'{row["Risk Score"]:.2f}', va='center')
+        for i, risk_score in enumerate(risk_df['Risk Score']):
+            ax1.text(risk_score + 0.01, i, f'{risk_score:.2f}', va='center')
         
         # 2. Risk Distribution
         ax2 = axes[0, 1]
-        risk_levels = risk_df['Risk Level'].value_counts()
+        # Only a handful of roles, so a Counter is cheaper than a pandas value_counts
+        level_names, level_counts = zip(*Counter(risk_df['Risk Level']).most_common())
         colors_pie = {'Very High': '#d62728', 'High': '#ff7f0e', 'Medium': '#ffdb58', 
                      'Low': '#2ca02c', 'Very Low': '#1f77b4'}
-        pie_colors = [colors_pie.get(level, '#gray') for level in risk_levels.index]
+        pie_colors = [colors_pie.get(level, '#gray') for level in level_names]
         
-        ax2.pie(risk_levels.values, labels=risk_levels.index, autopct='%1.1f%%', 
+        ax2.pie(level_counts, labels=level_names, autopct='%1.1f%%', 
                 colors=pie_colors, startangle=90)
         ax2.set_title('Distribution of Risk Levels', fontsize=14, fontweight='bold')
         
@@ -401,19 +425,11 @@ class AutomationRiskAnalyzer:
             f.write("="*60 + "\n\n")
             
             # Risk rankings
-            risk_df = pd.DataFrame([
-                {
-                    'Role': role,
-                    'Risk Score': self.calculate_automation_risk(role),
-                    'Risk Level': self.get_risk_level(self.calculate_automation_risk(role))
-                }
-                for role in self.role_risk_profiles
-            ]).sort_values('Risk Score', ascending=False)
+            risk_df = self.risk_rankings()
             
             f.write("AUTOMATION RISK RANKINGS\n")
             f.write("-"*60 + "\n")
-            for _, row in risk_df.iterrows():
-                f.write(f"{row['Role']:25} | Risk: {row['Risk Score']:.2f} ({row['Risk Level']})\n")
+            f.write(self._format_rankings(risk_df))
             
             f.write("\n" + "="*60 + "\n")
             f.write("END OF REPORT\n")
@@ -423,21 +439,10 @@ class AutomationRiskAnalyzer:
     
     def export_risk_data(self):
         """Export risk data for integration with main analysis"""
-        risk_data = []
-        
-        for role, profile in self.role_risk_profiles.items():
-            risk_score = self.calculate_automation_risk(role)
-            risk_data.append({
-                'role': role,
-                'automation_risk_score': risk_score,
-                'risk_level': self.get_risk_level(risk_score),
-                'routine_tasks': profile['routine_tasks'],
-                'human_interaction': profile['human_interaction'],
-                'creative_problem_solving': profile['creative_problem_solving'],
-                'technical_complexity': profile['technical_complexity']
-            })
-        
-        risk_df = pd.DataFrame(risk_data)
+        risk_df = self.risk_table[[
+            'automation_risk_score', 'risk_level', 'routine_tasks',
+            'human_interaction', 'creative_problem_solving', 'technical_complexity'
+        ]].reset_index()
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         export_filename = f"data/processed/automation_risk_scores_{timestamp}.csv"
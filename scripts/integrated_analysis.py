@@ -11,6 +11,14 @@ import sys
 import warnings
 warnings.filterwarnings('ignore')
 
+# Make the sibling analyzer modules importable from any working directory
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR)
+
+from job_market_analysis import JobMarketAnalyzer
+from automation_risk_analyzer import AutomationRiskAnalyzer
+
 # Set plotting style
 plt.style.use('seaborn-v0_8-darkgrid')
 sns.set_palette("husl")
@@ -33,78 +41,45 @@ class IntegratedWorkShiftAnalysis:
         
         # Initialize analyzers
         print("Initializing analyzers...")
-        try:
-            # Import the analyzers
-            from job_market_analysis import JobMarketAnalyzer
-            from automation_risk_analyzer import AutomationRiskAnalyzer
-            
-            self.market_analyzer = JobMarketAnalyzer(job_data_path)
-            self.risk_analyzer = AutomationRiskAnalyzer(job_data_path)
-        except ImportError as e:
-            print(f"Error importing modules: {e}")
-            print("Make sure job_market_analysis.py and automation_risk_analyzer.py are in the scripts folder")
-            sys.exit(1)
+        self.market_analyzer = JobMarketAnalyzer(job_data_path)
+        self.risk_analyzer = AutomationRiskAnalyzer(job_data_path)
         
         # Store integrated results
         self.integrated_df = None
+        self.safe_jobs = None
+        self.risky_jobs = None
+        self.safe_job_counts = None
+        self.risky_job_counts = None
+        self.search_term_stats = None
     
     def create_integrated_dataset(self):
         """Merge job market data with automation risk scores"""
         print("\nCreating integrated dataset...")
         
-        # Get job market data
+        # Get job market data; cleaning already mapped each search term to its risk_category
         market_df = self.market_analyzer.df.copy()
         
-        # Create risk_category mapping function
-        def map_to_risk_category(job_title):
-            """Map job titles to risk categories"""
-            if pd.isna(job_title):
-                return 'Software Engineer'
-                
-            title_lower = str(job_title).lower()
-            
-            mappings = {
-                'data scientist': 'Data Scientist',
-                'machine learning': 'Machine Learning Engineer',
-                'product manager': 'Product Manager',
-                'devops': 'DevOps Engineer',
-                'frontend': 'Frontend Developer',
-                'backend': 'Backend Developer',
-                'full stack': 'Full Stack Developer',
-                'software engineer': 'Software Engineer',
-                'software developer': 'Software Engineer',
-                'cloud engineer': 'Cloud Engineer',
-                'security engineer': 'Security Engineer',
-                'data analyst': 'Data Analyst'
-            }
-            
-            for keyword, category in mappings.items():
-                if keyword in title_lower:
-                    return category
-            return 'Software Engineer'  # Default
-        
-        # Apply the mapping to create risk_category column
-        market_df['risk_category'] = market_df['search_term'].apply(map_to_risk_category)
-        
-        # Get automation risk scores
-        risk_scores = {}
-        for role in self.risk_analyzer.role_risk_profiles:
-            risk_scores[role] = {
-                'automation_risk_score': self.risk_analyzer.calculate_automation_risk(role),
-                'risk_level': self.risk_analyzer.get_risk_level(
-                    self.risk_analyzer.calculate_automation_risk(role)
-                )
-            }
-        
-        # Map risk scores to job data
-        market_df['automation_risk_score'] = market_df['risk_category'].map(
-            lambda x: risk_scores.get(x, {}).get('automation_risk_score', 0.5)
+        # Map precomputed risk scores and levels to job data in vectorized lookups
+        market_df['automation_risk_score'] = self.risk_analyzer.calculate_automation_risk_batch(
+            market_df['risk_category']
         )
         market_df['risk_level'] = market_df['risk_category'].map(
-            lambda x: risk_scores.get(x, {}).get('risk_level', 'Medium')
-        )
+            self.risk_analyzer.risk_table['risk_level']
+        ).fillna('Medium')
         
         self.integrated_df = market_df
+        
+        # Split out the low- and high-risk segments once; several reports reuse them
+        self.safe_jobs = market_df[market_df['automation_risk_score'] < 0.3]
+        self.risky_jobs = market_df[market_df['automation_risk_score'] >= 0.5]
+        self.safe_job_counts = self.safe_jobs['search_term'].value_counts()
+        self.risky_job_counts = self.risky_jobs['search_term'].value_counts()
+        
+        # Risk follows from the search term, so one groupby gives each term's risk and average salary
+        self.search_term_stats = market_df.groupby('search_term').agg(
+            risk_score=('automation_risk_score', 'first'),
+            avg_salary=('salary_avg', 'mean')
+        )
         print(f"✓ Integrated dataset created with {len(self.integrated_df):,} records")
         
         return self.integrated_df
@@ -131,11 +106,11 @@ class IntegratedWorkShiftAnalysis:
         
         risk_salary.columns = ['avg_salary', 'risk_score', 'job_count']
         risk_salary = risk_salary.sort_values('risk_score', ascending=False)
+        risk_levels = self.risk_analyzer.get_risk_levels(risk_salary['risk_score'])
         
         print("\nAverage Salary by Automation Risk:")
         print("-" * 60)
-        for role, data in risk_salary.iterrows():
-            risk_level = self.risk_analyzer.get_risk_level(data['risk_score'])
+        for (role, data), risk_level in zip(risk_salary.iterrows(), risk_levels):
             print(f"{role:25} | Risk: {data['risk_score']:.2f} ({risk_level:10}) | "
                   f"Avg Salary: ${data['avg_salary']:,.0f} | Jobs: {int(data['job_count'])}")
         
@@ -168,21 +143,14 @@ class IntegratedWorkShiftAnalysis:
             print(f"{risk_level:15} | {count:5,} jobs ({percentage:5.1f}%)")
         
         # Analyze high-risk vs low-risk jobs
-        high_risk_jobs = self.integrated_df[
-            self.integrated_df['automation_risk_score'] >= 0.5
-        ]
-        low_risk_jobs = self.integrated_df[
-            self.integrated_df['automation_risk_score'] < 0.3
-        ]
-        
-        if len(high_risk_jobs) > 0:
+        if len(self.risky_jobs) > 0:
             print("\nMost Posted High-Risk Jobs (Risk ≥ 0.5):")
-            for job, count in high_risk_jobs['search_term'].value_counts().head(5).items():
+            for job, count in self.risky_job_counts.head(5).items():
                 print(f"  • {job}: {count:,} postings")
         
-        if len(low_risk_jobs) > 0:
+        if len(self.safe_jobs) > 0:
             print("\nMost Posted Low-Risk Jobs (Risk < 0.3):")
-            for job, count in low_risk_jobs['search_term'].value_counts().head(5).items():
+            for job, count in self.safe_job_counts.head(5).items():
                 print(f"  • {job}: {count:,} postings")
     
     def analyze_location_risk_patterns(self):
@@ -216,30 +184,18 @@ class IntegratedWorkShiftAnalysis:
         print("="*60)
         
         # 1. Safe haven analysis
-        safe_jobs = self.integrated_df[self.integrated_df['automation_risk_score'] < 0.3]
-        
-        if len(safe_jobs) > 0:
+        if len(self.safe_jobs) > 0:
             print("\n1. SAFE HAVEN CAREERS (Low automation risk + High demand):")
-            safe_job_counts = safe_jobs['search_term'].value_counts()
-            
-            for job, count in safe_job_counts.head(5).items():
-                job_data = safe_jobs[safe_jobs['search_term'] == job]
-                avg_salary = job_data['salary_avg'].mean()
+            for job, count in self.safe_job_counts.head(5).items():
+                risk_score, avg_salary = self.search_term_stats.loc[job]
                 salary_str = f"${avg_salary:,.0f}" if pd.notna(avg_salary) else "N/A"
-                risk_score = job_data['automation_risk_score'].iloc[0]
                 print(f"   • {job}: {count:,} openings | Risk: {risk_score:.2f} | Avg salary: {salary_str}")
         
         # 2. High risk but high demand
-        risky_jobs = self.integrated_df[self.integrated_df['automation_risk_score'] >= 0.5]
-        
-        if len(risky_jobs) > 0:
+        if len(self.risky_jobs) > 0:
             print("\n2. TRANSITION WARNING (High risk but still hiring):")
-            risky_job_counts = risky_jobs['search_term'].value_counts()
-            
-            for job, count in risky_job_counts.head(5).items():
-                job_data = risky_jobs[risky_jobs['search_term'] == job]
-                risk_score = job_data['automation_risk_score'].iloc[0]
-                avg_salary = job_data['salary_avg'].mean()
+            for job, count in self.risky_job_counts.head(5).items():
+                risk_score, avg_salary = self.search_term_stats.loc[job]
                 salary_str = f"${avg_salary:,.0f}" if pd.notna(avg_salary) else "N/A"
                 print(f"   • {job}: {count:,} openings | Risk: {risk_score:.2f} | Avg salary: {salary_str}")
         
@@ -459,8 +415,8 @@ class IntegratedWorkShiftAnalysis:
         ax5.axis('off')
         
         # Calculate key metrics
-        safe_jobs = self.integrated_df[self.integrated_df['automation_risk_score'] < 0.3]
-        risky_jobs = self.integrated_df[self.integrated_df['automation_risk_score'] >= 0.5]
+        safe_jobs = self.safe_jobs
+        risky_jobs = self.risky_jobs
         
         # Create insights text
         insights = [
@@ -476,7 +432,7 @@ class IntegratedWorkShiftAnalysis:
         
         # Add top safe careers
         if len(safe_jobs) > 0:
-            for i, (job, count) in enumerate(safe_jobs['search_term'].value_counts().head(3).items(), 1):
+            for i, (job, count) in enumerate(self.safe_job_counts.head(3).items(), 1):
                 insights.append(f"{i}. {job} ({count:,} jobs)")
         
         insights.extend([
@@ -486,8 +442,8 @@ class IntegratedWorkShiftAnalysis:
         
         # Add risky but popular jobs
         if len(risky_jobs) > 0:
-            for job, count in risky_jobs['search_term'].value_counts().head(2).items():
-                risk = risky_jobs[risky_jobs['search_term'] == job]['automation_risk_score'].iloc[0]
+            for job, count in self.risky_job_counts.head(2).items():
+                risk = self.search_term_stats.loc[job, 'risk_score']
                 insights.append(f"• {job} (Risk: {risk:.2f})")
         
         # Add salary insight
@@ -543,12 +499,11 @@ class IntegratedWorkShiftAnalysis:
             role_data = self.integrated_df[self.integrated_df['risk_category'] == role]
             
             if len(role_data) > 0:
+                risk_score, risk_level = self.risk_analyzer.risk_table.loc[role, ['automation_risk_score', 'risk_level']]
                 summary_data.append({
                     'Role': role,
-                    'Automation_Risk_Score': self.risk_analyzer.calculate_automation_risk(role),
-                    'Risk_Level': self.risk_analyzer.get_risk_level(
-                        self.risk_analyzer.calculate_automation_risk(role)
-                    ),
+                    'Automation_Risk_Score': risk_score,
+                    'Risk_Level': risk_level,
                     'Job_Count': len(role_data),
                     'Avg_Salary': role_data['salary_avg'].mean() if 'salary_avg' in role_data else np.nan,
                     'Min_Salary': role_data['salary_avg'].min() if 'salary_avg' in role_data else np.nan,
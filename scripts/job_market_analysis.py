@@ -3,16 +3,37 @@
 
 import pandas as pd
 import numpy as np
+import re
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
 import warnings
+from automation_risk_analyzer import map_to_risk_category
 warnings.filterwarnings('ignore')
 
 # Set plotting style
 plt.style.use('seaborn-v0_8-darkgrid')
 sns.set_palette("husl")
 
+# Two-letter state code after the city, e.g. "Austin, TX"
+STATE_PATTERN = re.compile(r', ([A-Z]{2})')
+
+def mean_count_by(keys, values):
+    """
+    Per-group mean and count of values, using bincount over factorized keys
+    
+    Equivalent to groupby(keys)[values].agg(['mean', 'count']) for non-null
+    values, without the groupby machinery. Missing keys are dropped.
+    """
+    codes, groups = pd.factorize(keys, sort=True)
+    present = codes >= 0
+    codes = codes[present]
+    values = np.asarray(values, dtype=float)[present]
+    
+    counts = np.bincount(codes, minlength=len(groups))
+    sums = np.bincount(codes, weights=values, minlength=len(groups))
+    return pd.DataFrame({'mean': sums / counts, 'count': counts}, index=groups)
+
 class JobMarketAnalyzer:
     """
     Professional job market data analyzer for WorkShift.AI
@@ -27,12 +48,15 @@ class JobMarketAnalyzer:
         """
         self.data_path = csv_file_path
         self.df = None
+        self._value_counts = {}
+        self._remote = None
         self.load_data()
     
     def load_data(self):
         """Load and perform initial data cleaning"""
         try:
-            self.df = pd.read_csv(self.data_path)
+            # The free-text description is the bulk of the file and no analysis reads it
+            self.df = pd.read_csv(self.data_path, usecols=lambda column: column != 'description')
             print(f"Data loaded successfully: {len(self.df)} records")
             print(f"Columns: {list(self.df.columns)}")
             
@@ -51,6 +75,8 @@ class JobMarketAnalyzer:
         print("\nCleaning data...")
         
         original_count = len(self.df)
+        self._value_counts = {}
+        self._remote = None
         
         # Remove duplicates
         self.df = self.df.drop_duplicates()
@@ -67,16 +93,36 @@ class JobMarketAnalyzer:
         # Calculate average salary where possible
         self.df['salary_avg'] = (self.df['salary_min'] + self.df['salary_max']) / 2
         
-        # Extract state from location
-        self.df['state'] = self.df['location'].str.extract(r', ([A-Z]{2})')[0]
+        # Extract state from location, running the regex once per distinct location
+        unique_locations = pd.Series(self.df['location'].dropna().unique())
+        states = unique_locations.str.extract(STATE_PATTERN, expand=False)
+        self.df['state'] = self.df['location'].map(dict(zip(unique_locations, states)))
+        
+        # Search terms repeat across thousands of postings, so categorize each distinct one once
+        search_terms = pd.Series(self.df['search_term'].dropna().unique())
         
         # Clean search terms for better categorization
-        self.df['job_category'] = self.df['search_term'].str.replace(' Engineer', '').str.replace(' Developer', '')
+        job_categories = search_terms.str.replace(' Engineer', '').str.replace(' Developer', '')
+        self.df['job_category'] = self.df['search_term'].map(dict(zip(search_terms, job_categories)))
         
         print(f"Data cleaned: {len(self.df)} records (removed {original_count - len(self.df)} duplicates)")
 
-        # Add risk category mapping
-        self.df['risk_category'] = self.df['search_term'].apply(self.map_to_risk_category)
+        # Add risk category mapping; missing search terms get the function's own default
+        risk_categories = {term: map_to_risk_category(term) for term in search_terms}
+        self.df['risk_category'] = self.df['search_term'].map(risk_categories).fillna(map_to_risk_category(None))
+    
+    def value_counts(self, column):
+        """Value counts for a column, computed once per cleaned dataset"""
+        if column not in self._value_counts:
+            self._value_counts[column] = self.df[column].value_counts()
+        return self._value_counts[column]
+    
+    def remote_jobs(self):
+        """Jobs with remote data and how many allow remote, computed once per cleaned dataset"""
+        if self._remote is None:
+            remote_df = self.df.dropna(subset=['remote_allowed'])
+            self._remote = (remote_df, remote_df['remote_allowed'].sum())
+        return self._remote
     
     def basic_statistics(self):
         """Display basic statistics about the dataset"""
@@ -85,13 +131,13 @@ class JobMarketAnalyzer:
         print("="*60)
         
         print(f"Total job postings: {len(self.df):,}")
-        print(f"Unique companies: {self.df['company'].nunique():,}")
-        print(f"Unique job titles: {self.df['title'].nunique():,}")
-        print(f"Unique locations: {self.df['location'].nunique():,}")
+        print(f"Unique companies: {len(self.value_counts('company')):,}")
+        print(f"Unique job titles: {len(self.value_counts('title')):,}")
+        print(f"Unique locations: {len(self.value_counts('location')):,}")
         print(f"Date range: {self.df['collected_date'].min()} to {self.df['collected_date'].max()}")
         
         print(f"\nData sources breakdown:")
-        for source, count in self.df['source'].value_counts().items():
+        for source, count in self.value_counts('source').items():
             print(f"  {source}: {count:,} jobs")
         
         print(f"\nSalary data availability:")
@@ -108,20 +154,20 @@ class JobMarketAnalyzer:
         print("="*60)
         
         # Job demand by search term
-        job_demand = self.df['search_term'].value_counts().head(10)
+        job_demand = self.value_counts('search_term').head(10)
         print("\nTop 10 Most In-Demand Roles:")
         for role, count in job_demand.items():
             print(f"  {role}: {count:,} postings")
         
         # Job demand by location
-        location_demand = self.df['location'].value_counts().head(10)
+        location_demand = self.value_counts('location').head(10)
         print("\nTop 10 Job Markets by Volume:")
         for location, count in location_demand.items():
             print(f"  {location}: {count:,} postings")
         
         # State-level analysis
         if 'state' in self.df.columns:
-            state_demand = self.df['state'].value_counts().head(10)
+            state_demand = self.value_counts('state').head(10)
             print("\nTop States for Tech Jobs:")
             for state, count in state_demand.items():
                 if pd.notna(state):
@@ -141,14 +187,16 @@ class JobMarketAnalyzer:
         
         print(f"Analyzing {len(salary_df):,} jobs with salary data")
         
-        # Overall salary statistics
+        # Overall salary statistics; one quantile call covers min, median and max
+        salaries = salary_df['salary_avg'].to_numpy()
+        salary_min, salary_median, salary_max = np.quantile(salaries, [0.0, 0.5, 1.0])
         print(f"\nOverall Salary Statistics:")
-        print(f"  Average salary: ${salary_df['salary_avg'].mean():,.0f}")
-        print(f"  Median salary: ${salary_df['salary_avg'].median():,.0f}")
-        print(f"  Salary range: ${salary_df['salary_avg'].min():,.0f} - ${salary_df['salary_avg'].max():,.0f}")
+        print(f"  Average salary: ${salaries.mean():,.0f}")
+        print(f"  Median salary: ${salary_median:,.0f}")
+        print(f"  Salary range: ${salary_min:,.0f} - ${salary_max:,.0f}")
         
         # Salary by job role
-        role_salaries = salary_df.groupby('search_term')['salary_avg'].agg(['mean', 'count']).round(0)
+        role_salaries = mean_count_by(salary_df['search_term'], salary_df['salary_avg']).round(0)
         role_salaries = role_salaries[role_salaries['count'] >= 5].sort_values('mean', ascending=False)
         
         print(f"\nAverage Salary by Role (min 5 jobs):")
@@ -156,7 +204,7 @@ class JobMarketAnalyzer:
             print(f"  {role}: ${data['mean']:,.0f} (based on {data['count']} jobs)")
         
         # Salary by location
-        location_salaries = salary_df.groupby('location')['salary_avg'].agg(['mean', 'count']).round(0)
+        location_salaries = mean_count_by(salary_df['location'], salary_df['salary_avg']).round(0)
         location_salaries = location_salaries[location_salaries['count'] >= 10].sort_values('mean', ascending=False)
         
         print(f"\nAverage Salary by Location (min 10 jobs):")
@@ -170,7 +218,7 @@ class JobMarketAnalyzer:
         print("="*60)
         
         # Top hiring companies
-        top_companies = self.df['company'].value_counts().head(15)
+        top_companies = self.value_counts('company').head(15)
         print("Top 15 Hiring Companies:")
         for company, count in top_companies.items():
             if company and company.strip():
@@ -184,10 +232,9 @@ class JobMarketAnalyzer:
         
         # Check if remote data exists
         if 'remote_allowed' in self.df.columns:
-            remote_df = self.df.dropna(subset=['remote_allowed'])
+            remote_df, remote_count = self.remote_jobs()
             
             if len(remote_df) > 0:
-                remote_count = remote_df['remote_allowed'].sum()
                 remote_percentage = (remote_count / len(remote_df)) * 100
                 
                 print(f"Remote work data available for {len(remote_df):,} jobs")
@@ -217,13 +264,13 @@ class JobMarketAnalyzer:
         fig.suptitle('WorkShift.AI - Job Market Analysis Dashboard', fontsize=16, fontweight='bold')
         
         # 1. Job demand by role
-        job_demand = self.df['search_term'].value_counts().head(8)
+        job_demand = self.value_counts('search_term').head(8)
         axes[0, 0].barh(job_demand.index, job_demand.values, color='skyblue')
         axes[0, 0].set_title('Job Demand by Role')
         axes[0, 0].set_xlabel('Number of Job Postings')
         
         # 2. Job demand by location
-        location_demand = self.df['location'].value_counts().head(8)
+        location_demand = self.value_counts('location').head(8)
         axes[0, 1].barh(location_demand.index, location_demand.values, color='lightcoral')
         axes[0, 1].set_title('Job Demand by Location')
         axes[0, 1].set_xlabel('Number of Job Postings')
@@ -240,7 +287,7 @@ class JobMarketAnalyzer:
             axes[1, 0].set_title('Salary Distribution')
         
         # 4. Data sources
-        source_counts = self.df['source'].value_counts()
+        source_counts = self.value_counts('source')
         axes[1, 1].pie(source_counts.values, labels=source_counts.index, autopct='%1.1f%%', startangle=90)
         axes[1, 1].set_title('Data Sources Distribution')
         
@@ -260,8 +307,8 @@ class JobMarketAnalyzer:
         print("="*60)
         
         # Most in-demand role
-        top_role = self.df['search_term'].value_counts().index[0]
-        top_role_count = self.df['search_term'].value_counts().iloc[0]
+        top_role = self.value_counts('search_term').index[0]
+        top_role_count = self.value_counts('search_term').iloc[0]
         
         print(f"1. HIGHEST DEMAND ROLE")
         print(f"   {top_role} with {top_role_count:,} job postings")
@@ -269,7 +316,7 @@ class JobMarketAnalyzer:
         # Best paying role (if salary data available)
         salary_df = self.df.dropna(subset=['salary_avg'])
         if len(salary_df) > 0:
-            role_salaries = salary_df.groupby('search_term')['salary_avg'].agg(['mean', 'count'])
+            role_salaries = mean_count_by(salary_df['search_term'], salary_df['salary_avg'])
             role_salaries = role_salaries[role_salaries['count'] >= 5]
             
             if len(role_salaries) > 0:
@@ -280,29 +327,30 @@ class JobMarketAnalyzer:
                 print(f"   {highest_paid_role} with average salary ${highest_salary:,.0f}")
         
         # Top job market
-        top_market = self.df['location'].value_counts().index[0]
-        top_market_count = self.df['location'].value_counts().iloc[0]
+        location_counts = self.value_counts('location')
+        top_market = location_counts.index[0]
+        top_market_count = location_counts.iloc[0]
         
         print(f"\n3. TOP JOB MARKET")
         print(f"   {top_market} with {top_market_count:,} job postings")
         
         # Top hiring company
-        top_company = self.df['company'].value_counts().index[0]
-        top_company_count = self.df['company'].value_counts().iloc[0]
+        top_company = self.value_counts('company').index[0]
+        top_company_count = self.value_counts('company').iloc[0]
         
         print(f"\n4. TOP HIRING COMPANY")
         print(f"   {top_company} with {top_company_count:,} job postings")
         
         # Remote work insights
         if 'remote_allowed' in self.df.columns:
-            remote_df = self.df.dropna(subset=['remote_allowed'])
+            remote_df, remote_count = self.remote_jobs()
             if len(remote_df) > 0:
-                remote_percentage = (remote_df['remote_allowed'].sum() / len(remote_df)) * 100
+                remote_percentage = (remote_count / len(remote_df)) * 100
                 print(f"\n5. REMOTE WORK AVAILABILITY")
                 print(f"   {remote_percentage:.1f}% of jobs offer remote work")
         
         # Market concentration
-        top_5_locations = self.df['location'].value_counts().head(5).sum()
+        top_5_locations = location_counts.head(5).sum()
         location_concentration = (top_5_locations / len(self.df)) * 100
         
         print(f"\n6. MARKET CONCENTRATION")
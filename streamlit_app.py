@@ -1,6 +1,32 @@
+import os
+import time
+
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
+import plotly.graph_objects as go
+
+DATA_PATH = "workshift_jobs.csv"
+
+# Columns the dashboard uses; the rest of the CSV is skipped while parsing
+JOB_COLUMNS = ["job_title", "company", "location", "salary_estimate", "automation_risk_score", "skills_required", "posted_date"]
+CATEGORY_COLUMNS = ["job_title", "company", "location", "skills_required"]
+FLOAT_COLUMNS = ["salary_estimate", "automation_risk_score"]
+
+# The charts are read-only views, so skip shipping and drawing Plotly's modebar
+PLOTLY_CONFIG = {"displayModeBar": False}
+
+# Filter selections whose aggregates and figures are kept, across all sessions;
+# least recently used ones (including those for replaced CSV versions) are evicted
+SELECTION_CACHE_ENTRIES = 64
+
+# Number of section timings kept per session for the render timings panel
+PERF_HISTORY = 200
+
+# The render timings panel is for operators only; enable it on the server with
+# WORKSHIFT_RENDER_TIMINGS=1 rather than exposing it to every user
+SHOW_RENDER_TIMINGS = os.environ.get("WORKSHIFT_RENDER_TIMINGS") == "1"
 
 # Page config
 st.set_page_config(
@@ -9,44 +35,124 @@ st.set_page_config(
     layout="wide"
 )
 
-# Load your data
-@st.cache_data
-def load_data():
+# Load your data; persisted to disk so restarts skip the CSV parse.
+# The dashboard reads the single DATA_PATH file; its modification time is the key
+# so a refreshed CSV is re-read.
+@st.cache_data(persist="disk", max_entries=2)
+def read_jobs(modified):
     # Replace this with your real CSV or DB call
-    return pd.read_csv("workshift_jobs.csv")
+    df = pd.read_csv(DATA_PATH, engine="pyarrow", usecols=JOB_COLUMNS)
+    # Categorical codes let value_counts/isin work on integers instead of strings;
+    # float32 is ample precision for salaries and 0-1 risk scores at half the memory
+    return df.astype({
+        **{col: "category" for col in CATEGORY_COLUMNS},
+        **{col: "float32" for col in FLOAT_COLUMNS},
+    })
+
+# Modification time of DATA_PATH when this server process last loaded it
+@st.cache_resource
+def loaded_version():
+    return {}
+
+# Returns the jobs frame with its version (the CSV's modification time); cached
+# functions downstream take the version as an argument so they refresh with the data
+def load_data():
+    modified = os.path.getmtime(DATA_PATH)
+    loaded = loaded_version()
+    if loaded.setdefault("modified", modified) != modified:
+        # max_entries only bounds the in-memory cache; clearing also drops the
+        # disk pickles of replaced versions so they don't pile up
+        read_jobs.clear()
+        loaded["modified"] = modified
+    return read_jobs(modified), modified
+
+# Apply the sidebar selections; an empty selection means no filter
+def select_jobs(df, locations, skills):
+    mask = pd.Series(True, index=df.index)
+    if locations:
+        mask &= df["location"].isin(locations)
+    if skills:
+        mask &= df["skills_required"].isin(skills)
+    return df[mask]
+
+# Everything the dashboard shows for a filter selection, computed from a single
+# filtered frame and cached so reruns skip the column scans
+@st.cache_data(max_entries=SELECTION_CACHE_ENTRIES)
+def summarize(modified, locations, skills):
+    jobs = select_jobs(read_jobs(modified), locations, skills)
+    job_counts = jobs["job_title"].value_counts()
+    # Categorical counts include titles filtered out of the selection
+    top_roles = job_counts[job_counts > 0].head(10).reset_index()
+    top_roles.columns = ["job_title", "count"]
+    # Bin on the server so only 20 bar heights are sent to the browser, not every score
+    risk_counts, risk_edges = np.histogram(jobs["automation_risk_score"].dropna().to_numpy(), bins=20)
+    return {
+        "total_jobs": len(jobs),
+        "avg_risk": jobs["automation_risk_score"].mean(),
+        "avg_salary": jobs["salary_estimate"].mean(),
+        "top_roles": top_roles,
+        "risk_counts": risk_counts,
+        "risk_edges": risk_edges,
+    }
+
+# Figures are cached as shared resources so reruns reuse them instead of rebuilding
+@st.cache_resource(max_entries=SELECTION_CACHE_ENTRIES)
+def build_demand_fig(modified, locations, skills):
+    return px.bar(summarize(modified, locations, skills)["top_roles"], x="count", y="job_title", orientation="h", title="Top 10 In-Demand Roles")
+
+@st.cache_resource(max_entries=SELECTION_CACHE_ENTRIES)
+def build_risk_fig(modified, locations, skills):
+    summary = summarize(modified, locations, skills)
+    risk_edges = summary["risk_edges"]
+    fig_risk = go.Figure(go.Bar(x=(risk_edges[:-1] + risk_edges[1:]) / 2, y=summary["risk_counts"], width=np.diff(risk_edges)))
+    fig_risk.update_layout(title="Automation Risk Score Distribution", xaxis_title="automation_risk_score", yaxis_title="count")
+    return fig_risk
 
-df = load_data()
+df, data_version = load_data()
 
-# Sidebar filters
+# Sidebar filters; categories are already unique and sorted
 st.sidebar.header("🔍 Filter Job Listings")
-locations = st.sidebar.multiselect("Select Location", df["location"].unique())
-skills = st.sidebar.multiselect("Select Required Skills", df["skills_required"].unique())
+locations = st.sidebar.multiselect("Select Location", df["location"].cat.categories)
+skills = st.sidebar.multiselect("Select Required Skills", df["skills_required"].cat.categories)
 
-filtered_df = df.copy()
+selection = (tuple(locations), tuple(skills))
 
-if locations:
-    filtered_df = filtered_df[filtered_df["location"].isin(locations)]
-if skills:
-    filtered_df = filtered_df[filtered_df["skills_required"].isin(skills)]
+# Dashboard sections
+def render_metrics(metrics):
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Total Jobs", metrics["total_jobs"])
+    col2.metric("Avg Automation Risk", f"{metrics['avg_risk']:.2f}")
+    col3.metric("Avg Salary", f"${metrics['avg_salary']:,.0f}")
 
-# Main dashboard
-st.title("📊 Workshift.AI - Tech Job Demand & Automation Risk")
+def render_demand(fig_demand):
+    st.markdown("### 🔥 Job Titles by Demand")
+    st.plotly_chart(fig_demand, use_container_width=True, config=PLOTLY_CONFIG)
+
+def render_risk(fig_risk):
+    st.markdown("### 🤖 Automation Risk Distribution")
+    st.plotly_chart(fig_risk, use_container_width=True, config=PLOTLY_CONFIG)
 
-col1, col2, col3 = st.columns(3)
-col1.metric("Total Jobs", len(filtered_df))
-col2.metric("Avg Automation Risk", f"{filtered_df['automation_risk_score'].mean():.2f}")
-col3.metric("Avg Salary", f"${filtered_df['salary_estimate'].mean():,.0f}")
+def render_listings(jobs):
+    st.markdown("### 📋 Job Listings")
+    st.dataframe(jobs[JOB_COLUMNS].reset_index(drop=True))
 
-st.markdown("### 🔥 Job Titles by Demand")
-job_counts = filtered_df["job_title"].value_counts().reset_index()
-job_counts.columns = ["job_title", "count"]
-fig_demand = px.bar(job_counts.head(10), x="count", y="job_title", orientation="h", title="Top 10 In-Demand Roles")
-st.plotly_chart(fig_demand, use_container_width=True)
+# Time each section so slow reruns can be traced to a section; sections are passed
+# as thunks so their (possibly cache-missing) data computation is inside the window
+def timed(section, render):
+    start = time.perf_counter()
+    render()
+    perf = st.session_state.setdefault("_perf", [])
+    perf.append((section, time.perf_counter() - start))
+    del perf[:-PERF_HISTORY]
 
-st.markdown("### 🤖 Automation Risk Distribution")
-fig_risk = px.histogram(filtered_df, x="automation_risk_score", nbins=20, title="Automation Risk Score Distribution")
-st.plotly_chart(fig_risk, use_container_width=True)
+# Main dashboard
+st.title("📊 Workshift.AI - Tech Job Demand & Automation Risk")
 
-st.markdown("### 📋 Job Listings")
-st.dataframe(filtered_df[["job_title", "company", "location", "salary_estimate", "automation_risk_score", "skills_required", "posted_date"]].reset_index(drop=True))
+timed("metrics", lambda: render_metrics(summarize(data_version, *selection)))
+timed("demand", lambda: render_demand(build_demand_fig(data_version, *selection)))
+timed("risk", lambda: render_risk(build_risk_fig(data_version, *selection)))
+timed("listings", lambda: render_listings(select_jobs(df, *selection)))
 
+if SHOW_RENDER_TIMINGS and st.sidebar.checkbox("Show render timings"):
+    perf = pd.DataFrame(st.session_state["_perf"], columns=["section", "seconds"])
+    st.sidebar.dataframe(perf.nlargest(20, "seconds"), hide_index=True)